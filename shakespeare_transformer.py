@@ -0,0 +1,804 @@
+#!/usr/bin/env python3
+"""
+Shakespeare Transformer CLI Tool
+
+A command-line tool that transforms modern English sentences into Shakespearean English
+using the Ollama API.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import httpx
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any
+from dotenv import load_dotenv
+
+load_dotenv()  # This loads environment variables from a .env file into os.environ
+
+try:
+    # Optional: libuv-backed event loop speeds up the batch fanout path;
+    # the stock asyncio loop is used when uvloop isn't installed
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+try:
+    # Optional: only needed for the embedding-based semantic cache
+    import numpy as np
+except ImportError:
+    np = None
+
+# Built once at import so per-call formatting is a single .format() instead of
+# re-assembling the multi-line literal and headers dict on every request
+_PROMPT_TMPL = """Transform the following modern English sentence into Shakespearean English.
+Use archaic vocabulary, thou/thee/thy pronouns, and elizabethan sentence structure.
+Only return the transformed sentence, nothing else.
+
+Modern sentence: "{sentence}"
+
+Shakespearean version:"""
+
+_HEADERS = {"Content-Type": "application/json"}
+
+# Fail unreachable hosts within seconds while still tolerating long
+# generations: small connect budget, generous read budget
+_SYNC_TIMEOUT = (3, 60)
+_ASYNC_TIMEOUT = httpx.Timeout(60.0, connect=3.0, read=60.0, write=5.0)
+
+# Bound generation: a one-sentence rewrite needs well under 96 tokens, and the
+# stop sequences cut decoding the moment the model starts echoing the scaffold
+_DEFAULT_OPTIONS = {
+    "temperature": 0.7,
+    "top_p": 0.9,
+    "num_predict": 96,
+    "stop": ["\n\n", "Modern sentence:", "Shakespearean"]
+}
+
+# First non-empty line that is not prompt-scaffold echo ("Transform...",
+# "Modern...", "Shakespearean...") - matched in one pass by the C regex engine
+_CLEAN_RE = re.compile(r'^\s*(?!Transform|Modern|Shakespearean)(\S.*?)\s*$', re.MULTILINE)
+
+class SemanticCache:
+    """
+    Embedding-based cache that reuses a stored transformation when a new
+    sentence is a close paraphrase of one seen before.
+
+    Embeddings come from Ollama's /api/embeddings endpoint; similarity is a
+    cosine comparison over all cached vectors in one NumPy matrix product,
+    so a hit costs one small embed request instead of a full generation.
+    """
+
+    def __init__(self, session: requests.Session, ollama_host: str, embed_model: str,
+                 threshold: float = 0.93):
+        """
+        Initialize the cache.
+
+        Args:
+            session: Pooled HTTP session for the embeddings requests
+            ollama_host: The Ollama API host URL
+            embed_model: Embedding model to use (e.g. 'nomic-embed-text')
+            threshold: Minimum cosine similarity to count as a paraphrase hit
+
+        Raises:
+            RuntimeError: If NumPy is not installed
+        """
+        if np is None:
+            raise RuntimeError("The semantic cache requires numpy. Install it with: pip install numpy")
+
+        self._session = session
+        self.embed_endpoint = f"{ollama_host}/api/embeddings"
+        self.embed_model = embed_model
+        self.threshold = threshold
+        self._vectors = None  # (N, D) float32 matrix of cached embeddings
+        self._norms = None    # (N,) vector norms, precomputed for cosine lookups
+        self._models: List[str] = []
+        self._responses: List[str] = []
+
+    def embed(self, sentence: str):
+        """
+        Fetch the embedding vector for a sentence, or None on any failure.
+
+        Failures are deliberately silent - the caller falls back to a plain
+        generation, so a missing embed model never breaks transformation.
+        """
+        payload = {
+            "model": self.embed_model,
+            "prompt": sentence
+        }
+
+        try:
+            response = self._session.post(
+                self.embed_endpoint,
+                data=orjson.dumps(payload),
+                headers=_HEADERS,
+                timeout=_SYNC_TIMEOUT
+            )
+
+            if response.status_code != 200:
+                return None
+
+            embedding = orjson.loads(response.content).get("embedding")
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+            return None
+
+        if not embedding:
+            return None
+
+        return np.asarray(embedding, dtype=np.float32)
+
+    def lookup(self, vector, model: str) -> Optional[str]:
+        """
+        Return the cached response most similar to vector, if close enough.
+
+        Only entries generated by the requested model are considered, so a
+        per-call model override never surfaces another model's output.
+
+        Args:
+            vector: Embedding of the new sentence (may be None)
+            model: The generation model the response must come from
+
+        Returns:
+            The cached transformation, or None on a miss
+        """
+        if vector is None or self._vectors is None:
+            return None
+
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+
+        other_model = np.fromiter(
+            (cached_model != model for cached_model in self._models),
+            dtype=bool, count=len(self._models)
+        )
+        if other_model.all():
+            return None
+
+        similarities = (self._vectors @ vector) / (self._norms * norm)
+        similarities[other_model] = -1.0
+        best = int(np.argmax(similarities))
+
+        if similarities[best] >= self.threshold:
+            return self._responses[best]
+
+        return None
+
+    def store(self, vector, model: str, response: Optional[str]) -> None:
+        """Add a (vector, response) pair generated by model to the cache."""
+        if vector is None or not response:
+            return
+
+        norm = np.asarray([np.linalg.norm(vector)], dtype=np.float32)
+        if self._vectors is None:
+            self._vectors = vector[None, :]
+            self._norms = norm
+        else:
+            self._vectors = np.vstack([self._vectors, vector[None, :]])
+            self._norms = np.concatenate([self._norms, norm])
+        self._models.append(model)
+        self._responses.append(response)
+
+
+class ShakespeareTransformer:
+    """Main class for handling Shakespeare text transformation."""
+    
+    def __init__(self, ollama_host: Optional[str] = None, model: Optional[str] = None,
+                 keep_alive: str = "10m", temperature: Optional[float] = None,
+                 top_p: Optional[float] = None, num_predict: Optional[int] = None,
+                 embed_model: Optional[str] = None):
+        """
+        Initialize the transformer with Ollama API configuration.
+
+        Args:
+            ollama_host: The Ollama API host URL
+            model: The default model to use
+            keep_alive: How long Ollama should keep the model loaded between calls
+            temperature: Sampling temperature (default 0.7)
+            top_p: Nucleus sampling threshold (default 0.9)
+            num_predict: Maximum tokens to generate (default 96)
+            embed_model: Embedding model enabling the semantic cache (disabled if None)
+        """
+        self.ollama_host = (ollama_host or os.getenv("BARDSPEAK_OLLAMA_HOST", "http://localhost:11434")).rstrip('/')
+        self.default_model = model or os.getenv("BARDSPEAK_OLLAMA_MODEL", "llama2")
+        self.keep_alive = keep_alive
+        self.api_endpoint = f"{self.ollama_host}/api/generate"
+
+        self.options = dict(_DEFAULT_OPTIONS)
+        if temperature is not None:
+            self.options["temperature"] = temperature
+        if top_p is not None:
+            self.options["top_p"] = top_p
+        if num_predict is not None:
+            self.options["num_predict"] = num_predict
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+        # Pooled session so repeated calls reuse TCP/TLS connections instead
+        # of paying a fresh handshake per request. Transient 5xx responses are
+        # retried with backoff inside the same connection - POST must be
+        # allowed explicitly since urllib3 won't retry it by default
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["POST"])
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Per-instance LRU cache keyed on (model, lowercased sentence) so
+        # repeated inputs skip the LLM round trip entirely, while the model
+        # still receives the caller's original text on a miss
+        self._exact_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._exact_cache_maxsize = 1024
+
+        # Optional paraphrase-level cache on top of the exact-match one
+        embed_model = embed_model or os.getenv("BARDSPEAK_EMBED_MODEL")
+        self._semantic_cache = (
+            SemanticCache(self._session, self.ollama_host, embed_model)
+            if embed_model else None
+        )
+
+    def warm_up(self) -> None:
+        """
+        Ask Ollama to load the default model ahead of the first real request.
+
+        An empty prompt makes Ollama load the model without generating any
+        tokens; combined with keep_alive the first transformation then hits
+        a warm model instead of paying the cold-load cost. Errors are
+        ignored - the real request will surface them.
+        """
+        payload = {
+            "model": self.default_model,
+            "prompt": "",
+            "keep_alive": self.keep_alive
+        }
+
+        try:
+            self._session.post(
+                self.api_endpoint,
+                data=orjson.dumps(payload),
+                headers=_HEADERS,
+                timeout=(3, 5)
+            )
+        except requests.exceptions.RequestException:
+            pass
+
+    def warm_up_in_background(self) -> threading.Thread:
+        """Run warm_up on a daemon thread so callers don't wait on it."""
+        thread = threading.Thread(target=self.warm_up, daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the transformer."""
+        self._session.close()
+
+    def __enter__(self) -> "ShakespeareTransformer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Create the shared async HTTP client on first use.
+
+        HTTP/2 lets concurrent batch requests multiplex over one connection
+        when the server negotiates it; httpx falls back to HTTP/1.1
+        keep-alive transparently otherwise. The connection cap can be tuned
+        via the BARDSPEAK_MAX_CONNECTIONS environment variable.
+        """
+        if self._async_client is None or self._async_client.is_closed:
+            max_connections = int(os.getenv("BARDSPEAK_MAX_CONNECTIONS", "256"))
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                timeout=_ASYNC_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections // 2
+                )
+            )
+        return self._async_client
+
+    def _first_clean_line(self, text: str) -> Optional[str]:
+        """
+        Return the first usable line of model output, or None if none qualifies.
+
+        Args:
+            text: Raw (possibly partial) response text from the model
+        """
+        match = _CLEAN_RE.search(text)
+        return match.group(1) if match else None
+
+    def _extract_transformed_line(self, transformed_text: str) -> str:
+        """
+        Clean up the API response - remove any extra formatting or explanations.
+
+        Args:
+            transformed_text: The raw response text from the model
+
+        Returns:
+            The first usable line, or the full text if no line qualifies
+        """
+        return self._first_clean_line(transformed_text) or transformed_text
+
+    def _consume_stream(self, response: requests.Response) -> str:
+        """
+        Read streamed NDJSON chunks and stop at the first complete usable line.
+
+        Once a newline-terminated line of real output has arrived, the
+        connection is closed so Ollama does not keep generating tokens the
+        cleanup step would discard anyway.
+
+        Args:
+            response: A streaming response from the /api/generate endpoint
+
+        Returns:
+            The cleaned transformed text
+
+        Raises:
+            RuntimeError: If the model returned no text
+        """
+        buffer = ""
+        raw_lines = []
+        line_iterator = response.iter_lines()
+
+        try:
+            for raw_line in line_iterator:
+                if not raw_line:
+                    continue
+
+                raw_lines.append(raw_line)
+
+                try:
+                    chunk = orjson.loads(raw_line)
+                except orjson.JSONDecodeError:
+                    # Server ignored streaming and sent one plain JSON body
+                    # (older Ollama versions) - parse it whole instead
+                    raw_lines.extend(line for line in line_iterator if line)
+                    chunk = orjson.loads(b'\n'.join(raw_lines))
+
+                buffer += chunk.get("response", "")
+
+                # Everything before the last newline is final output - return
+                # as soon as it contains a usable line
+                completed, newline, _ = buffer.rpartition('\n')
+                if newline:
+                    first_line = self._first_clean_line(completed)
+                    if first_line:
+                        return first_line
+
+                if chunk.get("done"):
+                    break
+        finally:
+            response.close()
+
+        transformed_text = buffer.strip()
+
+        if not transformed_text:
+            raise RuntimeError("Empty response from Ollama API")
+
+        return self._extract_transformed_line(transformed_text)
+
+    def _exact_cache_get(self, cache_key: tuple) -> Optional[str]:
+        """Return the cached transformation for cache_key, if present."""
+        result = self._exact_cache.get(cache_key)
+        if result is not None:
+            self._exact_cache.move_to_end(cache_key)
+        return result
+
+    def _exact_cache_put(self, cache_key: tuple, result: Optional[str]) -> None:
+        """Store a transformation, evicting the least recently used entry."""
+        if not result:
+            return
+        self._exact_cache[cache_key] = result
+        self._exact_cache.move_to_end(cache_key)
+        if len(self._exact_cache) > self._exact_cache_maxsize:
+            self._exact_cache.popitem(last=False)
+
+    def transform_to_shakespeare(self, sentence: str, model: Optional[str] = None) -> Optional[str]:
+        """
+        Transform a modern English sentence to Shakespearean English.
+        
+        Args:
+            sentence: The modern English sentence to transform
+            model: The Ollama model to use for transformation (uses default if None)
+            
+        Returns:
+            The transformed Shakespearean text or None if transformation fails
+        """
+        sentence = sentence.strip()
+        if not sentence:
+            raise ValueError("Input sentence cannot be empty")
+
+        # Use provided model or fall back to default
+        selected_model = model or self.default_model
+
+        # The lowercased form is only a cache key - the model always sees the
+        # original text, so casing never changes what gets generated
+        cache_key = (selected_model, sentence.lower())
+
+        cached = self._exact_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # The semantic cache additionally catches paraphrases of earlier inputs
+        vector = None
+        if self._semantic_cache is not None:
+            vector = self._semantic_cache.embed(cache_key[1])
+            cached = self._semantic_cache.lookup(vector, selected_model)
+            if cached is not None:
+                return cached
+
+        result = self._do_transform(selected_model, sentence)
+
+        self._exact_cache_put(cache_key, result)
+        if self._semantic_cache is not None:
+            self._semantic_cache.store(vector, selected_model, result)
+
+        return result
+
+    def _do_transform(self, selected_model: str, sentence: str) -> Optional[str]:
+        """
+        Issue the actual Ollama request for a (model, sentence) pair.
+
+        Called on cache misses from transform_to_shakespeare, which handles
+        both the exact-match and semantic caches.
+
+        Args:
+            selected_model: The Ollama model to use
+            sentence: The stripped sentence to transform
+
+        Returns:
+            The transformed Shakespearean text or None if transformation fails
+        """
+        # Craft a specific prompt for Shakespeare transformation
+        prompt = _PROMPT_TMPL.format(sentence=sentence)
+
+        payload = {
+            "model": selected_model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive,
+            "options": self.options
+        }
+
+        try:
+            response = self._session.post(
+                self.api_endpoint,
+                data=orjson.dumps(payload),
+                headers=_HEADERS,
+                timeout=_SYNC_TIMEOUT,
+                stream=True
+            )
+
+            if response.status_code == 200:
+                return self._consume_stream(response)
+            elif response.status_code == 404:
+                raise RuntimeError(f"Model '{selected_model}' not found. Please ensure the model is installed in Ollama.")
+            else:
+                raise RuntimeError(f"API request failed with status {response.status_code}: {response.text}")
+                
+        except requests.exceptions.ConnectionError:
+            raise RuntimeError(f"Cannot connect to Ollama API at {self.ollama_host}. Please ensure Ollama is running.")
+        except requests.exceptions.Timeout:
+            raise RuntimeError("Request to Ollama API timed out. Please try again.")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Network error occurred: {str(e)}")
+        except json.JSONDecodeError:
+            raise RuntimeError("Invalid JSON response from Ollama API")
+
+    async def atransform_to_shakespeare(self, sentence: str, model: Optional[str] = None) -> Optional[str]:
+        """
+        Async counterpart of transform_to_shakespeare.
+
+        Uses a shared httpx.AsyncClient so many sentences can be transformed
+        concurrently over pooled connections.
+
+        Args:
+            sentence: The modern English sentence to transform
+            model: The Ollama model to use for transformation (uses default if None)
+
+        Returns:
+            The transformed Shakespearean text or None if transformation fails
+        """
+        if not sentence.strip():
+            raise ValueError("Input sentence cannot be empty")
+
+        # Use provided model or fall back to default
+        selected_model = model or self.default_model
+
+        # Craft a specific prompt for Shakespeare transformation
+        prompt = _PROMPT_TMPL.format(sentence=sentence)
+
+        payload = {
+            "model": selected_model,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": self.keep_alive,
+            "options": self.options
+        }
+
+        client = self._get_async_client()
+
+        try:
+            response = await client.post(
+                self.api_endpoint,
+                content=orjson.dumps(payload),
+                headers=_HEADERS
+            )
+
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                transformed_text = result.get("response", "").strip()
+
+                if transformed_text:
+                    return self._extract_transformed_line(transformed_text)
+                else:
+                    raise RuntimeError("Empty response from Ollama API")
+
+            elif response.status_code == 404:
+                raise RuntimeError(f"Model '{selected_model}' not found. Please ensure the model is installed in Ollama.")
+            else:
+                raise RuntimeError(f"API request failed with status {response.status_code}: {response.text}")
+
+        except httpx.ConnectError:
+            raise RuntimeError(f"Cannot connect to Ollama API at {self.ollama_host}. Please ensure Ollama is running.")
+        except httpx.TimeoutException:
+            raise RuntimeError("Request to Ollama API timed out. Please try again.")
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"Network error occurred: {str(e)}")
+        except json.JSONDecodeError:
+            raise RuntimeError("Invalid JSON response from Ollama API")
+
+    def transform_batch(self, sentences: List[str], model: Optional[str] = None,
+                        concurrency: int = 8) -> List[Optional[str]]:
+        """
+        Transform several sentences concurrently.
+
+        Requests overlap via asyncio.gather with a semaphore bounding how
+        many are in flight at once, so a batch completes in roughly
+        ceil(N / concurrency) times the single-call latency rather than the
+        sum of all of them.
+
+        Args:
+            sentences: The modern English sentences to transform
+            model: The Ollama model to use for transformation (uses default if None)
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            The transformed sentences, in the same order as the input
+        """
+        async def _run_batch() -> List[Optional[str]]:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def _bounded(sentence: str) -> Optional[str]:
+                async with semaphore:
+                    return await self.atransform_to_shakespeare(sentence, model)
+
+            try:
+                return list(await asyncio.gather(
+                    *(_bounded(sentence) for sentence in sentences)
+                ))
+            finally:
+                if self._async_client is not None and not self._async_client.is_closed:
+                    await self._async_client.aclose()
+
+        return asyncio.run(_run_batch())
+
+
+def validate_input(sentence: str) -> str:
+    """
+    Validate and clean the input sentence.
+    
+    Args:
+        sentence: The input sentence to validate
+        
+    Returns:
+        The cleaned sentence
+        
+    Raises:
+        ValueError: If the sentence is invalid
+    """
+    if not sentence:
+        raise ValueError("Please provide a sentence to transform")
+
+    # Reject oversized input before any stripping or prompt building. The
+    # byte check measures what is actually sent to Ollama so multi-byte text
+    # can't slip past the character limit; 500 characters or fewer can never
+    # exceed 2000 bytes (UTF-8 is at most 4 bytes per code point), so typical
+    # inputs skip the encode entirely
+    if len(sentence) > 1000 or (
+        len(sentence) > 500 and len(sentence.encode("utf-8", errors="ignore")) > 2000
+    ):
+        raise ValueError("Sentence is too long (maximum 1000 characters / 2000 UTF-8 bytes)")
+
+    sentence = sentence.strip()
+
+    if not sentence:
+        raise ValueError("Sentence cannot be empty or contain only whitespace")
+
+    return sentence
+
+
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Transform modern English sentences to Shakespearean English using Ollama API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s "Hello, how are you today?"
+  %(prog)s "I am going to the store" --model llama2
+  %(prog)s "What a beautiful day!" --host http://192.168.1.100:11434
+
+Note: Ensure Ollama is running and has a compatible model installed (e.g., llama2, mistral).
+        """
+    )
+    
+    parser.add_argument(
+        "sentence",
+        nargs="*",
+        help="One or more sentences to transform into Shakespearean English (use '-' to read from stdin)"
+    )
+
+    parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read sentences from stdin, one per line"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent requests in batch mode (default 8)"
+    )
+    
+    parser.add_argument(
+        "--model",
+        default=None,
+        help="Ollama model to use for transformation (default from OLLAMA_MODEL env var or 'llama2')"
+    )
+    
+    parser.add_argument(
+        "--host",
+        default=None,
+        help="Ollama API host URL (default from OLLAMA_HOST env var or 'http://localhost:11434')"
+    )
+    
+    parser.add_argument(
+        "--embed-model",
+        default=None,
+        help="Embedding model for the semantic cache, e.g. nomic-embed-text "
+             "(default from BARDSPEAK_EMBED_MODEL env var; disabled if unset)"
+    )
+
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=None,
+        help="Sampling temperature (default 0.7)"
+    )
+
+    parser.add_argument(
+        "--top-p",
+        type=float,
+        default=None,
+        help="Nucleus sampling threshold (default 0.9)"
+    )
+
+    parser.add_argument(
+        "--num-predict",
+        type=int,
+        default=None,
+        help="Maximum number of tokens to generate (default 96)"
+    )
+
+    parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Enable verbose output"
+    )
+    
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    # Build the parser once per process - repeated main() calls (server/REPL
+    # wrappers) reuse it, and plain imports never pay for it
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+
+    args = _PARSER.parse_args()
+
+    try:
+        # Validate input - batch mode streams sentences from stdin
+        if args.stdin or args.sentence == ["-"]:
+            sentences = [validate_input(line) for line in sys.stdin if line.strip()]
+            if not sentences:
+                raise ValueError("No sentences received on stdin")
+        elif args.sentence:
+            sentences = [validate_input(sentence) for sentence in args.sentence]
+        else:
+            _PARSER.error("provide at least one sentence, or use --stdin / '-'")
+
+        if args.verbose:
+            for sentence in sentences:
+                print(f"Original sentence: {sentence}")
+
+        # Initialize transformer with optional overrides
+        transformer = ShakespeareTransformer(
+            ollama_host=args.host,
+            model=args.model,
+            temperature=args.temperature,
+            top_p=args.top_p,
+            num_predict=args.num_predict,
+            embed_model=args.embed_model
+        )
+
+        # Start loading the model server-side while we finish local setup
+        transformer.warm_up_in_background()
+
+        if args.verbose:
+            print(f"Ollama host: {transformer.ollama_host}")
+            print(f"Using model: {transformer.default_model}")
+            print("Transforming...")
+
+        # Perform transformation - fan out concurrently when given several sentences
+        if len(sentences) > 1:
+            results = transformer.transform_batch(sentences, concurrency=args.concurrency)
+        else:
+            results = [transformer.transform_to_shakespeare(sentences[0])]
+
+        failed = False
+        for result in results:
+            if result:
+                print(result)
+            else:
+                print("Error: Failed to transform sentence", file=sys.stderr)
+                failed = True
+
+        if failed:
+            sys.exit(1)
+
+    except ValueError as e:
+        print(f"Input error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nOperation cancelled by user", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Unexpected error: {e}", file=sys.stderr)
+        if args.verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()